@@ -1,5 +1,7 @@
 """Allow running as: python -m claude_orchestrator"""
 
+import sys
+
 from .cli import main
 
-main()
+sys.exit(main())
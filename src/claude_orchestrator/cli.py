@@ -1,42 +1,73 @@
 """CLI for claude-orchestrator."""
 
 import argparse
-import importlib.resources as resources
-import json
+import functools
+import os
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
+if TYPE_CHECKING:
+	from importlib.resources.abc import Traversable
 
+
+def _exists(path: Path) -> bool:
+	"""Check whether a path exists with a single lstat (symlinks are not followed)."""
+	try:
+		os.lstat(path)
+	except FileNotFoundError:
+		return False
+	return True
+
+
+def _has_content(path: Path, content: bytes) -> bool:
+	"""Check whether a file already holds exactly this content."""
+	try:
+		return path.read_bytes() == content
+	except OSError:
+		return False
+
+
+def _package_files() -> "Traversable":
+	"""Return the package resource root, importing importlib.resources on first use."""
+	import importlib.resources as resources
+	return resources.files("claude_orchestrator")
+
+
+@functools.cache
 def _get_bundled_file(filename: str) -> str:
 	"""Read a bundled file from the package."""
-	ref = resources.files("claude_orchestrator").joinpath(filename)
+	ref = _package_files().joinpath(filename)
 	return ref.read_text(encoding="utf-8")
 
 
-def _get_bundled_agent_files() -> list[tuple[str, str]]:
-	"""Get all bundled agent .md files as (name, content) tuples."""
-	agents_pkg = resources.files("claude_orchestrator").joinpath("agents")
-	results = []
-	for item in agents_pkg.iterdir():
-		if item.name.endswith(".md"):
-			results.append((item.name, item.read_text(encoding="utf-8")))
-	return results
+@functools.cache
+def _get_bundled_agent_files() -> tuple[tuple[str, bytes], ...]:
+	"""Get all bundled agent .md files as (name, raw content) tuples."""
+	agents_pkg = _package_files().joinpath("agents")
+	return tuple(
+		(item.name, item.read_bytes())
+		for item in agents_pkg.iterdir()
+		if item.name.endswith(".md")
+	)
 
 
-def _get_bundled_hook(filename: str) -> str:
-	"""Read a bundled hook script from the package."""
-	ref = resources.files("claude_orchestrator").joinpath(f"hooks/{filename}")
-	return ref.read_text(encoding="utf-8")
+@functools.cache
+def _get_bundled_hook(filename: str) -> bytes:
+	"""Read a bundled hook script from the package as raw bytes."""
+	ref = _package_files().joinpath(f"hooks/{filename}")
+	return ref.read_bytes()
 
 
-def cmd_serve(args: argparse.Namespace) -> None:
+def cmd_serve(args: argparse.Namespace) -> int:
 	"""Run the MCP server (stdio transport)."""
 	from .server import mcp
 	mcp.run()
+	return 0
 
 
-def cmd_install(args: argparse.Namespace) -> None:
+def cmd_install(args: argparse.Namespace) -> int:
 	"""Install workflow protocol, agents, and hooks into Claude Code."""
 	force = getattr(args, "force", False)
 	print("claude-orchestrator install")
@@ -62,37 +93,41 @@ def cmd_install(args: argparse.Namespace) -> None:
 	print()
 
 	print("Done. Restart Claude Code to pick up changes.")
+	return 0
 
 
 def _install_protocol(claude_md_path: Path, force: bool) -> None:
 	"""Install or update the Workflow Protocol section in CLAUDE.md."""
+	from .fileio import write_file
+
 	protocol_content = _get_bundled_file("protocol.md")
 
-	if not claude_md_path.exists():
-		claude_md_path.write_text(protocol_content + "\n", encoding="utf-8")
+	try:
+		existing = claude_md_path.read_text(encoding="utf-8")
+	except FileNotFoundError:
+		write_file(claude_md_path, protocol_content + "\n")
 		print(f"  Created: {claude_md_path}")
 		return
 
-	existing = claude_md_path.read_text(encoding="utf-8")
-
-	# Check if section already exists
-	section_pattern = r"## Workflow Protocol.*?(?=\n## |\Z)"
-	match = re.search(section_pattern, existing, re.DOTALL)
-
-	if match and not force:
+	# Plain substring check first; the section regex is only needed to replace it
+	has_section = "## Workflow Protocol" in existing
+	if has_section and not force:
 		print(f"  Workflow Protocol section already exists in {claude_md_path}")
 		print("  Use --force to replace it.")
 		return
 
+	section_pattern = r"## Workflow Protocol.*?(?=\n## |\Z)"
+	match = re.search(section_pattern, existing, re.DOTALL) if has_section else None
+
 	if match:
 		# Replace existing section
 		new_content = existing[:match.start()] + protocol_content.strip() + "\n" + existing[match.end():]
-		claude_md_path.write_text(new_content, encoding="utf-8")
+		write_file(claude_md_path, new_content)
 		print(f"  Replaced Workflow Protocol section in {claude_md_path}")
 	else:
 		# Append new section
 		separator = "\n\n" if not existing.endswith("\n\n") else "\n" if not existing.endswith("\n") else ""
-		claude_md_path.write_text(existing + separator + protocol_content.strip() + "\n", encoding="utf-8")
+		write_file(claude_md_path, existing + separator + protocol_content.strip() + "\n")
 		print(f"  Appended Workflow Protocol section to {claude_md_path}")
 
 
@@ -100,17 +135,24 @@ def _install_agents(agents_dir: Path, force: bool) -> None:
 	"""Install bundled agent .md files to agents directory."""
 	agents_dir.mkdir(parents=True, exist_ok=True)
 
+	with os.scandir(agents_dir) as it:
+		existing = {entry.name for entry in it}
+
 	installed = 0
+	unchanged = 0
 	skipped = 0
 	for filename, content in _get_bundled_agent_files():
 		target = agents_dir / filename
-		if target.exists() and not force:
+		if filename in existing and not force:
 			skipped += 1
 			continue
-		target.write_text(content, encoding="utf-8")
+		if filename in existing and _has_content(target, content):
+			unchanged += 1
+			continue
+		target.write_bytes(content)
 		installed += 1
 
-	print(f"  {installed} installed, {skipped} skipped in {agents_dir}")
+	print(f"  {installed} installed, {unchanged} unchanged, {skipped} skipped in {agents_dir}")
 	if skipped and not force:
 		print("  Use --force to overwrite existing files.")
 
@@ -123,97 +165,147 @@ def _install_hook(claude_dir: Path, force: bool) -> None:
 	hook_target = scripts_dir / "workflow-session-start.sh"
 	hook_content = _get_bundled_hook("session-start.sh")
 
-	if hook_target.exists() and not force:
+	hook_exists = _exists(hook_target)
+	if hook_exists and not force:
 		print(f"  Hook already exists: {hook_target}")
 		print("  Use --force to overwrite.")
+	elif hook_exists and _has_content(hook_target, hook_content):
+		# Content matches, but --force should still repair a lost exec bit
+		hook_target.chmod(0o755)
+		print(f"  Hook already up to date: {hook_target}")
 	else:
-		hook_target.write_text(hook_content, encoding="utf-8")
+		hook_target.write_bytes(hook_content)
 		hook_target.chmod(0o755)
-		action = "Replaced" if hook_target.exists() else "Installed"
+		action = "Replaced" if hook_exists else "Installed"
 		print(f"  {action}: {hook_target}")
 
-	# Update settings.json with hook config and env vars
-	settings_path = claude_dir / "settings.json"
-	_update_hook_settings(settings_path, str(hook_target))
-	_ensure_env_settings(settings_path)
+	# Update settings.json with hook config and env vars in a single read/write
+	_update_settings(
+		claude_dir / "settings.json",
+		functools.partial(_add_session_hook, hook_script=str(hook_target)),
+		_enable_agent_teams,
+	)
 
 
-def _update_hook_settings(settings_path: Path, hook_script: str) -> None:
-	"""Add SessionStart hook to settings.json."""
+def _load_settings(settings_path: Path) -> dict[str, Any]:
+	"""Load settings.json from raw bytes, or an empty dict if it doesn't exist."""
+	import json
+
 	try:
-		if settings_path.exists():
-			data = json.loads(settings_path.read_text(encoding="utf-8"))
-		else:
-			data = {}
-
-		if "hooks" not in data:
-			data["hooks"] = {}
-
-		# New matcher-group format required by Claude Code
-		hook_entry = {
-			"matcher": "",
-			"hooks": [
-				{
-					"type": "command",
-					"command": hook_script,
-				}
-			],
-		}
-
-		# Check if our hook is already configured (look inside nested hooks arrays)
-		session_hooks = data["hooks"].get("SessionStart", [])
-		already_configured = any(
-			any(
-				inner.get("command") == hook_script
-				for inner in group.get("hooks", [])
-				if isinstance(inner, dict)
-			)
-			for group in session_hooks
-			if isinstance(group, dict)
-		)
+		raw = settings_path.read_bytes()
+	except FileNotFoundError:
+		return {}
+	data = json.loads(raw)
+	if not isinstance(data, dict):
+		raise ValueError("settings.json does not contain a JSON object")
+	return data
 
-		if already_configured:
-			print(f"  SessionStart hook already configured in {settings_path}")
-			return
 
-		session_hooks.append(hook_entry)
-		data["hooks"]["SessionStart"] = session_hooks
+def _write_settings(settings_path: Path, data: dict[str, Any]) -> None:
+	"""Write settings.json atomically."""
+	import json
 
-		settings_path.write_text(json.dumps(data, indent="\t") + "\n", encoding="utf-8")
-		print(f"  Added SessionStart hook to {settings_path}")
+	from .fileio import write_file
+
+	write_file(settings_path, json.dumps(data, indent="\t") + "\n")
 
-	except (json.JSONDecodeError, IOError) as e:
-		print(f"  Failed to update {settings_path}: {e}")
 
+def _update_settings(
+	settings_path: Path,
+	*updates: Callable[[dict[str, Any], Path], tuple[bool, str]],
+) -> None:
+	"""
+	Read settings.json once, apply each update, and write it back once if any changed it.
 
-def _ensure_env_settings(settings_path: Path) -> None:
-	"""Ensure agent teams env var is set in settings.json."""
+	Each update returns (changed, message); messages are printed only after the write
+	succeeds, so a failed write never follows a success line.
+	"""
+	messages: list[str] = []
 	try:
-		if settings_path.exists():
-			data = json.loads(settings_path.read_text(encoding="utf-8"))
-		else:
-			data = {}
+		data = _load_settings(settings_path)
+		changed = False
+		for update in updates:
+			updated, message = update(data, settings_path)
+			changed = updated or changed
+			messages.append(message)
+		if changed:
+			_write_settings(settings_path, data)
+	except (ValueError, OSError) as e:  # json.JSONDecodeError is a ValueError
+		print(f"  Failed to update {settings_path}: {e}")
+		return
 
-		env = data.get("env", {})
-		if env.get("CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS") == "1":
-			print(f"  Agent teams env var already set in {settings_path}")
-			return
+	for message in messages:
+		print(message)
+
+
+def _add_session_hook(data: dict[str, Any], settings_path: Path, hook_script: str) -> tuple[bool, str]:
+	"""Add the SessionStart hook entry to settings data. Returns (changed, message)."""
+	if "hooks" not in data:
+		data["hooks"] = {}
+
+	# New matcher-group format required by Claude Code
+	hook_entry = {
+		"matcher": "",
+		"hooks": [
+			{
+				"type": "command",
+				"command": hook_script,
+			}
+		],
+	}
+
+	# Check if our hook is already configured (look inside nested hooks arrays)
+	session_hooks = data["hooks"].get("SessionStart", [])
+	already_configured = any(
+		any(
+			inner.get("command") == hook_script
+			for inner in group.get("hooks", [])
+			if isinstance(inner, dict)
+		)
+		for group in session_hooks
+		if isinstance(group, dict)
+	)
 
-		env["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] = "1"
-		data["env"] = env
+	if already_configured:
+		return False, f"  SessionStart hook already configured in {settings_path}"
 
-		settings_path.write_text(json.dumps(data, indent="\t") + "\n", encoding="utf-8")
-		print(f"  Enabled agent teams in {settings_path}")
+	session_hooks.append(hook_entry)
+	data["hooks"]["SessionStart"] = session_hooks
+	return True, f"  Added SessionStart hook to {settings_path}"
+
+
+def _enable_agent_teams(data: dict[str, Any], settings_path: Path) -> tuple[bool, str]:
+	"""Set the agent teams env var in settings data. Returns (changed, message)."""
+	env = data.get("env", {})
+	if env.get("CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS") == "1":
+		return False, f"  Agent teams env var already set in {settings_path}"
+
+	env["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] = "1"
+	data["env"] = env
+	return True, f"  Enabled agent teams in {settings_path}"
+
+
+def _get_version() -> str:
+	"""Return the installed package version, falling back to __version__."""
+	from importlib.metadata import PackageNotFoundError, version
+	try:
+		return version("claude-orchestrator")
+	except PackageNotFoundError:
+		from . import __version__
+		return __version__
 
-	except (json.JSONDecodeError, IOError) as e:
-		print(f"  Failed to update {settings_path}: {e}")
 
+def main() -> int:
+	"""CLI entry point. Returns the process exit code."""
+	# Answer a bare --version before any parser is built
+	if sys.argv[1:] in (["--version"], ["-V"]):
+		print(f"claude-orchestrator {_get_version()}")
+		return 0
 
-def main() -> None:
-	"""CLI entry point."""
 	parser = argparse.ArgumentParser(
 		prog="claude-orchestrator",
 		description="Lightweight workflow system for Claude Code",
+		epilog="Use --version (-V) to print the installed version.",
 	)
 	subparsers = parser.add_subparsers(dest="command")
 
@@ -233,6 +325,7 @@ def main() -> None:
 
 	if not args.command:
 		parser.print_help()
-		sys.exit(1)
+		return 1
 
-	args.func(args)
+	func: Callable[[argparse.Namespace], int] = args.func
+	return func(args)
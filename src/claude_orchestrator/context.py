@@ -1,11 +1,15 @@
 """Project Discovery - Auto-discovers projects for find_project and list_my_projects."""
 
+import os
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Optional
 
+from .config import get_config
 
-@dataclass
+_SKIP_DIRS = frozenset({"venv", "__pycache__", "node_modules"})
+
+
+@dataclass(slots=True)
 class ProjectInfo:
 	"""Information about a personal project."""
 	name: str
@@ -15,7 +19,7 @@ class ProjectInfo:
 	aliases: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectRegistry:
 	"""Lightweight project registry."""
 	projects: list["ProjectInfo"] = field(default_factory=list)
@@ -25,60 +29,80 @@ class ContextManager:
 	"""Discovers and searches personal projects."""
 
 	def __init__(self, projects_path: str = ""):
-		from .config import get_config
 		config = get_config()
 		self._projects_path = projects_path or str(config.projects_path)
 		self._registry: Optional[ProjectRegistry] = None
+		self._name_index: dict[str, ProjectInfo] = {}
+		# (lowercased name, lowercased aliases, project), built once per registry load
+		self._search_keys: list[tuple[str, tuple[str, ...], ProjectInfo]] = []
+		self._registry_mtime_ns: Optional[int] = None
 
 	def load(self) -> ProjectRegistry:
-		"""Load project registry via auto-discovery."""
-		if self._registry:
+		"""Load project registry via auto-discovery.
+
+		The registry is reused until the projects folder's mtime changes,
+		i.e. until a project directory is added, removed or renamed.
+		"""
+		try:
+			mtime_ns: Optional[int] = os.stat(self._projects_path).st_mtime_ns
+		except OSError:
+			mtime_ns = None
+
+		if self._registry is not None and mtime_ns == self._registry_mtime_ns:
 			return self._registry
 
+		self._registry_mtime_ns = mtime_ns
 		self._registry = ProjectRegistry(
 			projects=self._discover_projects()
 		)
+		self._name_index = {}
+		self._search_keys = []
+		for project in self._registry.projects:
+			name_lc = project.name.lower()
+			self._name_index.setdefault(name_lc, project)
+			self._search_keys.append((name_lc, tuple(alias.lower() for alias in project.aliases), project))
 		return self._registry
 
 	def _discover_projects(self) -> list[ProjectInfo]:
 		"""Auto-discover projects from the projects folder."""
 		projects: list[ProjectInfo] = []
-		projects_path = Path(self._projects_path)
 
-		if not projects_path.exists():
-			return projects
-
-		for item in projects_path.iterdir():
-			if not item.is_dir():
-				continue
-			if item.name.startswith(".") or item.name in ["venv", "__pycache__", "node_modules"]:
-				continue
-
-			projects.append(ProjectInfo(
-				name=item.name,
-				path=str(item),
-				description=f"Project: {item.name}",
-			))
+		try:
+			with os.scandir(self._projects_path) as it:
+				for entry in it:
+					if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+						continue
+					if not entry.is_dir():
+						continue
+
+					projects.append(ProjectInfo(
+						name=entry.name,
+						path=entry.path,
+						description=f"Project: {entry.name}",
+					))
+		except (FileNotFoundError, NotADirectoryError):
+			pass
 
 		return projects
 
 	def find_project(self, query: str) -> Optional[ProjectInfo]:
 		"""Find a project by name or alias."""
-		registry = self.load()
+		self.load()
 		query_lower = query.lower()
 
-		for project in registry.projects:
-			# Exact name match
-			if project.name.lower() == query_lower:
-				return project
+		# Exact name match wins over any partial match
+		exact = self._name_index.get(query_lower)
+		if exact:
+			return exact
 
+		for name_lc, aliases_lc, project in self._search_keys:
 			# Partial name match
-			if query_lower in project.name.lower():
+			if query_lower in name_lc:
 				return project
 
 			# Alias match
-			for alias in project.aliases:
-				if query_lower in alias.lower() or alias.lower() in query_lower:
+			for alias in aliases_lc:
+				if query_lower in alias or alias in query_lower:
 					return project
 
 		return None
@@ -0,0 +1,36 @@
+"""File helpers shared by the CLI installer and the project memory tools."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# os has no getter for the umask; read it once at import, before any worker threads run
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_file(path: Path, content: str) -> None:
+	"""
+	Write content to a file atomically.
+
+	The content goes to a uniquely named temp file in the same directory, which then
+	replaces the target. An existing target keeps its permissions; a new file gets the
+	usual umask-derived mode. A symlinked target is resolved so the link itself survives.
+	"""
+	target = path.resolve()
+	fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+	try:
+		with os.fdopen(fd, "w", encoding="utf-8") as f:
+			f.write(content)
+		try:
+			shutil.copymode(target, tmp_name)
+		except FileNotFoundError:
+			os.chmod(tmp_name, 0o666 & ~_UMASK)
+		os.replace(tmp_name, target)
+	except BaseException:
+		try:
+			os.unlink(tmp_name)
+		except FileNotFoundError:
+			pass
+		raise
@@ -14,6 +14,7 @@ Checks:
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -31,7 +32,7 @@ class CheckStatus(str, Enum):
 	ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
 	"""Result of a single verification check."""
 	name: str
@@ -45,7 +46,7 @@ class CheckResult:
 			self.details = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
 	"""Result of full verification suite."""
 	passed: bool
@@ -73,7 +74,7 @@ class Verifier:
 	"""
 
 	# Standard checks to run
-	STANDARD_CHECKS = ["pytest", "ruff", "mypy", "bandit"]
+	STANDARD_CHECKS: tuple[str, ...] = ("pytest", "ruff", "mypy", "bandit")
 
 	def __init__(
 		self,
@@ -108,23 +109,16 @@ class Verifier:
 		Returns:
 			VerificationResult with all check results
 		"""
-		checks = checks or self.STANDARD_CHECKS
-		results = []
-
-		for check in checks:
-			try:
-				result = await self._run_check(check, files_changed)
-			except asyncio.TimeoutError:
-				result = CheckResult(
-					name=check,
-					status=CheckStatus.ERROR,
-					output=f"Check '{check}' timed out",
-				)
-			results.append(result)
+		checks_to_run = checks or self.STANDARD_CHECKS
+
+		# Checks are independent subprocesses, so run them concurrently
+		results = list(await asyncio.gather(
+			*(self._run_check_with_timeout(check, files_changed) for check in checks_to_run)
+		))
 
 		# Overall pass if all checks pass
 		all_passed = all(
-			r.status in [CheckStatus.PASSED, CheckStatus.SKIPPED]
+			r.status in (CheckStatus.PASSED, CheckStatus.SKIPPED)
 			for r in results
 		)
 
@@ -137,14 +131,27 @@ class Verifier:
 			can_retry=can_retry,
 		)
 
+	async def _run_check_with_timeout(
+		self,
+		check: str,
+		files_changed: Optional[list[str]] = None,
+	) -> CheckResult:
+		"""Run a single check, converting a timeout into an ERROR result."""
+		try:
+			return await self._run_check(check, files_changed)
+		except asyncio.TimeoutError:
+			return CheckResult(
+				name=check,
+				status=CheckStatus.ERROR,
+				output=f"Check '{check}' timed out",
+			)
+
 	async def _run_check(
 		self,
 		check: str,
 		files_changed: Optional[list[str]] = None,
 	) -> CheckResult:
 		"""Run a single verification check."""
-		datetime.now()
-
 		try:
 			if check == "pytest":
 				return await self._run_pytest(files_changed)
@@ -311,7 +318,7 @@ class Verifier:
 
 	async def _run_command(self, cmd: list[str]) -> dict[str, Any]:
 		"""Run a command asynchronously."""
-		start = datetime.now()
+		start = time.monotonic()
 
 		try:
 			proc = await asyncio.create_subprocess_exec(
@@ -326,7 +333,7 @@ class Verifier:
 				timeout=self.timeout,
 			)
 
-			duration = (datetime.now() - start).total_seconds()
+			duration = time.monotonic() - start
 
 			return {
 				"output": stdout.decode("utf-8", errors="replace"),
@@ -355,7 +362,7 @@ class Verifier:
 		Returns:
 			CheckResult
 		"""
-		start = datetime.now()
+		start = time.monotonic()
 
 		try:
 			proc = await asyncio.create_subprocess_shell(
@@ -370,7 +377,7 @@ class Verifier:
 				timeout=self.timeout,
 			)
 
-			duration = (datetime.now() - start).total_seconds()
+			duration = time.monotonic() - start
 
 			status = CheckStatus.PASSED if proc.returncode == 0 else CheckStatus.FAILED
 
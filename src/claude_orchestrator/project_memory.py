@@ -13,6 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .fileio import write_file
+
+# Section patterns used on every CLAUDE.md update
+_STATUS_SECTION_RE = re.compile(r"(## Implementation Status.*?)((?=\n## )|$)", re.DOTALL)
+_CURRENT_PHASE_RE = re.compile(r"(### Current Phase\n).*?(\n### |\n## |$)", re.DOTALL)
+_DECISIONS_LOG_RE = re.compile(r"(## Decisions Log.*?\n\|.*?\|.*?\|.*?\|.*?\|\n)", re.DOTALL)
+_LAST_UPDATED_RE = re.compile(r"\*Last updated:.*\*")
+
 
 def find_project_claude_md(project_path: str) -> Optional[Path]:
 	"""Find CLAUDE.md file in project directory."""
@@ -28,11 +36,6 @@ def read_file(path: Path) -> str:
 	return path.read_text(encoding="utf-8")
 
 
-def write_file(path: Path, content: str) -> None:
-	"""Write content to file."""
-	path.write_text(content, encoding="utf-8")
-
-
 def update_implementation_status(
 	project_path: str,
 	phase_completed: str = "",
@@ -58,8 +61,7 @@ def update_implementation_status(
 	content = read_file(claude_md)
 
 	# Find Implementation Status section
-	status_pattern = r"(## Implementation Status.*?)((?=\n## )|$)"
-	match = re.search(status_pattern, content, re.DOTALL)
+	match = _STATUS_SECTION_RE.search(content)
 
 	if not match:
 		return {"success": False, "error": "No Implementation Status section found"}
@@ -69,17 +71,15 @@ def update_implementation_status(
 	# Update completed phase: change [ ] to [x] and add commit hash
 	if phase_completed:
 		# Match the phase in "Remaining" or as unchecked
-		phase_pattern = rf"- \[ \] {re.escape(phase_completed)}"
 		commit_suffix = f" (commit: {commit_hash})" if commit_hash else ""
 		replacement = f"- [x] {phase_completed}{commit_suffix}"
-		status_section = re.sub(phase_pattern, replacement, status_section)
+		status_section = status_section.replace(f"- [ ] {phase_completed}", replacement)
 
 	# Update current phase
 	if phase_started:
 		# Update "Current Phase" subsection
-		current_pattern = r"(### Current Phase\n).*?(\n### |\n## |$)"
 		current_replacement = rf"\1- {phase_started} (in progress)\n- Current focus: Starting phase\n\2"
-		status_section = re.sub(current_pattern, current_replacement, status_section, flags=re.DOTALL)
+		status_section = _CURRENT_PHASE_RE.sub(current_replacement, status_section)
 
 	# Replace in original content
 	new_content = content[:match.start()] + status_section + content[match.end():]
@@ -113,8 +113,7 @@ def log_decision(
 	content = read_file(claude_md)
 
 	# Find Decisions Log section
-	log_pattern = r"(## Decisions Log.*?\n\|.*?\|.*?\|.*?\|.*?\|\n)"
-	match = re.search(log_pattern, content, re.DOTALL)
+	match = _DECISIONS_LOG_RE.search(content)
 
 	if not match:
 		return {"success": False, "error": "No Decisions Log section found"}
@@ -154,11 +153,12 @@ def log_gotcha(
 	content = read_file(claude_md)
 
 	# Find Gotchas section
-	gotcha_pattern = r"(## Gotchas & Learnings\n)"
-	match = re.search(gotcha_pattern, content)
+	gotcha_header = "## Gotchas & Learnings\n"
+	header_pos = content.find(gotcha_header)
 
-	if not match:
+	if header_pos == -1:
 		return {"success": False, "error": "No Gotchas & Learnings section found"}
+	section_start = header_pos + len(gotcha_header)
 
 	# Format based on type
 	type_prefix = {
@@ -170,12 +170,12 @@ def log_gotcha(
 	new_line = f"- {type_prefix}: {description}\n"
 
 	# Find the end of the section (next ## or end of file)
-	section_end = content.find("\n## ", match.end())
+	section_end = content.find("\n## ", section_start)
 	if section_end == -1:
 		section_end = len(content)
 
 	# Deduplicate: skip if an identical gotcha already exists in the section
-	section_text = content[match.end():section_end]
+	section_text = content[section_start:section_end]
 	if new_line.strip() in section_text:
 		return {"success": True, "message": "Gotcha already exists, skipped duplicate"}
 
@@ -220,16 +220,16 @@ def log_global_learning(
 		return {"success": False, "error": f"Unknown category: {category}"}
 
 	# Find section
-	section_pattern = rf"({re.escape(section_header)}\n)"
-	match = re.search(section_pattern, content)
+	header_pos = content.find(section_header + "\n")
 
-	if not match:
+	if header_pos == -1:
 		return {"success": False, "error": f"Section not found: {section_header}"}
+	section_start = header_pos + len(section_header) + 1
 
 	# Find end of section (next ## or ---)
-	section_end = content.find("\n## ", match.end())
+	section_end = content.find("\n## ", section_start)
 	if section_end == -1:
-		section_end = content.find("\n---", match.end())
+		section_end = content.find("\n---", section_start)
 	if section_end == -1:
 		section_end = len(content)
 
@@ -238,11 +238,9 @@ def log_global_learning(
 
 	# Insert at end of section (before next section)
 	new_content = content[:section_end] + new_entry + content[section_end:]
-	write_file(global_file, new_content)
 
-	# Update timestamp
-	new_content = re.sub(
-		r"\*Last updated:.*\*",
+	# Update timestamp, then write the file once
+	new_content = _LAST_UPDATED_RE.sub(
 		f"*Last updated: {datetime.now().strftime('%Y-%m-%d')}*",
 		new_content
 	)
@@ -2,9 +2,9 @@
 
 from mcp.server.fastmcp import FastMCP
 
-from .config import load_config
+from .config import get_config
 from .tools import register_all_tools
 
 mcp = FastMCP("claude-orchestrator")
-config = load_config()
+config = get_config()
 register_all_tools(mcp, config)
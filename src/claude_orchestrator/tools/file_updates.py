@@ -0,0 +1,16 @@
+"""Shared path for MCP tools that rewrite project files."""
+
+import asyncio
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# One lock for every tool that edits CLAUDE.md, global learnings or .claude-project/,
+# so concurrent tool calls can't interleave read-modify-write cycles on the same file
+_update_lock = asyncio.Lock()
+
+
+async def run_file_update(func: Callable[..., T], *args: Any) -> T:
+	"""Run a blocking file update in a worker thread, one update at a time."""
+	async with _update_lock:
+		return await asyncio.to_thread(func, *args)
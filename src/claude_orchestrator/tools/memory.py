@@ -7,11 +7,11 @@ from mcp.server.fastmcp import FastMCP
 
 from .. import project_memory
 from ..config import Config
+from .file_updates import run_file_update
 
 
 def register_memory_tools(mcp: FastMCP, config: Config) -> None:
 	"""Register project memory tools."""
-
 	@mcp.tool()
 	async def update_project_status(
 		project_path: str,
@@ -31,8 +31,9 @@ def register_memory_tools(mcp: FastMCP, config: Config) -> None:
 			commit_hash: Git commit hash for the completed phase (optional)
 		"""
 		expanded_path = str(Path(project_path).expanduser())
-		result = project_memory.update_implementation_status(
-			expanded_path, phase_completed, phase_started, commit_hash
+		result = await run_file_update(
+			project_memory.update_implementation_status,
+			expanded_path, phase_completed, phase_started, commit_hash,
 		)
 		return json.dumps(result)
 
@@ -53,7 +54,9 @@ def register_memory_tools(mcp: FastMCP, config: Config) -> None:
 			alternatives: What alternatives were rejected
 		"""
 		expanded_path = str(Path(project_path).expanduser())
-		result = project_memory.log_decision(expanded_path, decision, rationale, alternatives)
+		result = await run_file_update(
+			project_memory.log_decision, expanded_path, decision, rationale, alternatives
+		)
 		return json.dumps(result)
 
 	@mcp.tool()
@@ -71,7 +74,7 @@ def register_memory_tools(mcp: FastMCP, config: Config) -> None:
 			description: Description of the gotcha
 		"""
 		expanded_path = str(Path(project_path).expanduser())
-		result = project_memory.log_gotcha(expanded_path, gotcha_type, description)
+		result = await run_file_update(project_memory.log_gotcha, expanded_path, gotcha_type, description)
 		return json.dumps(result)
 
 	@mcp.tool()
@@ -85,5 +88,5 @@ def register_memory_tools(mcp: FastMCP, config: Config) -> None:
 			category: Category - "preference", "pattern", "gotcha", or "decision"
 			content: The learning to add (formatted as a bullet point)
 		"""
-		result = project_memory.log_global_learning(category, content)
+		result = await run_file_update(project_memory.log_global_learning, category, content)
 		return json.dumps(result)
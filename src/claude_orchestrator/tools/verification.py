@@ -10,6 +10,7 @@ from mcp.server.fastmcp import FastMCP
 from .. import project_memory
 from ..config import Config
 from ..orchestrator.verifier import CheckResult, CheckStatus, Verifier
+from .file_updates import run_file_update
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,16 @@ logger = logging.getLogger(__name__)
 SECURITY_PATTERNS = {"auth", "security", "crypt", "password", "token", "secret", "credential", "permission"}
 ARCHITECTURE_PATTERNS = {"config", "settings", "init", "main", "core", "base", "registry"}
 
+# Case-insensitive alternations so file paths are scanned without building a lowercased copy
+_SECURITY_RE = re.compile("|".join(map(re.escape, sorted(SECURITY_PATTERNS))), re.IGNORECASE)
+_ARCHITECTURE_RE = re.compile("|".join(map(re.escape, sorted(ARCHITECTURE_PATTERNS))), re.IGNORECASE)
+
+# Output parsers for turning check failures into gotchas
+_RUFF_CODE_RE = re.compile(r"\b([A-Z]\d{3,4})\b")
+_PYTEST_FAILED_RE = re.compile(r"FAILED\s+(\S+)")
+_MYPY_ERRORS_RE = re.compile(r"Found (\d+) error")
+_BANDIT_SEVERITY_RE = re.compile(r"Severity:\s+(High|Medium|Low)")
+
 
 def _should_recommend_consensus_review(files_changed: list[str] | None) -> tuple[bool, str]:
 	"""Determine if consensus review should be recommended based on changed files."""
@@ -27,20 +38,12 @@ def _should_recommend_consensus_review(files_changed: list[str] | None) -> tuple
 	reasons = []
 
 	# Check for security-sensitive files
-	security_files = []
-	for f in files_changed:
-		f_lower = f.lower()
-		if any(pattern in f_lower for pattern in SECURITY_PATTERNS):
-			security_files.append(f)
+	security_files = [f for f in files_changed if _SECURITY_RE.search(f)]
 	if security_files:
 		reasons.append(f"security-sensitive files: {', '.join(security_files[:3])}")
 
 	# Check for architecture files
-	arch_files = []
-	for f in files_changed:
-		f_lower = f.lower()
-		if any(pattern in f_lower for pattern in ARCHITECTURE_PATTERNS):
-			arch_files.append(f)
+	arch_files = [f for f in files_changed if _ARCHITECTURE_RE.search(f)]
 	if arch_files:
 		reasons.append(f"architecture files: {', '.join(arch_files[:3])}")
 
@@ -62,14 +65,14 @@ def _derive_gotcha_from_failure(check: CheckResult) -> str | None:
 
 	if check.name == "ruff":
 		# Extract unique rule codes like E501, F841, I001
-		codes = set(re.findall(r"\b([A-Z]\d{3,4})\b", output))
+		codes = set(_RUFF_CODE_RE.findall(output))
 		if codes:
 			return f"Linting: fix {', '.join(sorted(codes))} violations before committing"
 		return "Linting: ruff check failed -- fix lint errors before committing"
 
 	if check.name == "pytest":
 		# Extract failed test names
-		failed = re.findall(r"FAILED\s+(\S+)", output)
+		failed = _PYTEST_FAILED_RE.findall(output)
 		if failed:
 			names = ", ".join(f[:60] for f in failed[:3])
 			suffix = f" (+{len(failed) - 3} more)" if len(failed) > 3 else ""
@@ -78,13 +81,13 @@ def _derive_gotcha_from_failure(check: CheckResult) -> str | None:
 
 	if check.name == "mypy":
 		# Extract error count
-		error_match = re.search(r"Found (\d+) error", output)
+		error_match = _MYPY_ERRORS_RE.search(output)
 		count = error_match.group(1) if error_match else "multiple"
 		return f"Types: fix {count} mypy type error(s) before committing"
 
 	if check.name == "bandit":
 		# Extract severity levels
-		severities = re.findall(r"Severity:\s+(High|Medium|Low)", output)
+		severities = _BANDIT_SEVERITY_RE.findall(output)
 		if severities:
 			high = severities.count("High")
 			med = severities.count("Medium")
@@ -134,7 +137,7 @@ def register_verification_tools(mcp: FastMCP, config: Config) -> None:
 				if check.status == CheckStatus.FAILED:
 					gotcha = _derive_gotcha_from_failure(check)
 					if gotcha:
-						project_memory.log_gotcha(proj_dir, "dont", gotcha)
+						await run_file_update(project_memory.log_gotcha, proj_dir, "dont", gotcha)
 						gotchas_logged.append(gotcha)
 
 		response: dict[str, object] = {
@@ -6,11 +6,11 @@ from mcp.server.fastmcp import FastMCP
 
 from ..config import Config
 from ..workflow import check_tool_availability, init_workflow, update_progress
+from .file_updates import run_file_update
 
 
 def register_workflow_tools(mcp: FastMCP, config: Config) -> None:
 	"""Register workflow lifecycle tools."""
-
 	@mcp.tool()
 	async def init_project_workflow(project_path: str = "") -> str:
 		"""
@@ -23,7 +23,7 @@ def register_workflow_tools(mcp: FastMCP, config: Config) -> None:
 			project_path: Path to project directory (default: current directory)
 		"""
 		path = project_path or "."
-		result = init_workflow(path)
+		result = await run_file_update(init_workflow, path)
 		return json.dumps(result, indent=2)
 
 	@mcp.tool()
@@ -45,7 +45,9 @@ def register_workflow_tools(mcp: FastMCP, config: Config) -> None:
 			summary: Brief summary of what was accomplished
 		"""
 		path = project_path or "."
-		result = update_progress(path, phase_completed, phase_started, commit_hash, summary)
+		result = await run_file_update(
+			update_progress, path, phase_completed, phase_started, commit_hash, summary
+		)
 		return json.dumps(result, indent=2)
 
 	@mcp.tool()
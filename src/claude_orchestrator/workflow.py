@@ -1,5 +1,6 @@
 """Workflow lifecycle management for the four-document system."""
 
+import os
 import shutil
 from dataclasses import dataclass
 from datetime import datetime
@@ -59,8 +60,14 @@ Last Commit: None
 <!-- Completed phases appear here with <details> tags -->
 """
 
+_TEMPLATES = (
+	("discover.md", DISCOVER_TEMPLATE),
+	("plan.md", PLAN_TEMPLATE),
+	("progress.md", PROGRESS_TEMPLATE),
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class WorkflowState:
 	"""Current state of a project's workflow."""
 	project_path: str
@@ -73,7 +80,7 @@ class WorkflowState:
 	has_discover: bool
 	has_plan: bool
 	has_progress: bool
-	research_topics: list[str]
+	research_topics: tuple[str, ...]
 
 
 def init_workflow(project_path: str) -> dict[str, object]:
@@ -93,18 +100,12 @@ def init_workflow(project_path: str) -> dict[str, object]:
 	research_dir = workflow_dir / "research"
 	research_dir.mkdir(exist_ok=True)
 
-	templates = {
-		"discover.md": DISCOVER_TEMPLATE,
-		"plan.md": PLAN_TEMPLATE,
-		"progress.md": PROGRESS_TEMPLATE,
-	}
-
-	for filename, content in templates.items():
-		filepath = workflow_dir / filename
-		if filepath.exists():
+	existing = _existing_names(workflow_dir) or set()
+	for filename, content in _TEMPLATES:
+		if filename in existing:
 			skipped.append(filename)
 		else:
-			filepath.write_text(content, encoding="utf-8")
+			(workflow_dir / filename).write_text(content, encoding="utf-8")
 			created.append(filename)
 
 	return {
@@ -120,7 +121,8 @@ def get_workflow_state(project_path: str) -> WorkflowState:
 	base = Path(project_path).expanduser().resolve()
 	workflow_dir = base / WORKFLOW_DIR
 
-	if not workflow_dir.exists():
+	names = _existing_names(workflow_dir)
+	if names is None:
 		return WorkflowState(
 			project_path=str(base),
 			exists=False,
@@ -132,21 +134,19 @@ def get_workflow_state(project_path: str) -> WorkflowState:
 			has_discover=False,
 			has_plan=False,
 			has_progress=False,
-			research_topics=[],
+			research_topics=(),
 		)
 
-	has_discover = (workflow_dir / "discover.md").exists()
-	has_plan = (workflow_dir / "plan.md").exists()
-	has_progress = (workflow_dir / "progress.md").exists()
+	has_discover = "discover.md" in names
+	has_plan = "plan.md" in names
+	has_progress = "progress.md" in names
 
 	# Scan research topics
-	research_dir = workflow_dir / "research"
-	research_topics: list[str] = []
-	if research_dir.exists():
-		research_topics = [
-			f.stem for f in sorted(research_dir.iterdir())
-			if f.suffix == ".md"
-		]
+	research_names = _existing_names(workflow_dir / "research") if "research" in names else None
+	research_topics = tuple(
+		name[:-3] for name in sorted(research_names or ())
+		if name.endswith(".md") and len(name) > 3
+	)
 
 	# Parse progress.md
 	current_phase = "Not started"
@@ -247,15 +247,19 @@ def update_progress(
 def check_tool_availability(tools_required: list[str]) -> dict[str, object]:
 	"""Check availability of MCP tools and CLI tools."""
 	results: dict[str, str] = {}
+	venv_bin: set[str] | None = None
 
 	for tool in tools_required:
 		if _is_mcp_tool(tool):
 			results[tool] = "mcp (assumed available)"
 		else:
-			# Check PATH first, then fall back to .venv/bin/
+			# Check PATH first, then fall back to .venv/bin/ (listed once per call)
 			if shutil.which(tool) is not None:
 				results[tool] = "available"
-			elif (Path(".venv") / "bin" / tool).exists():
+				continue
+			if venv_bin is None:
+				venv_bin = _existing_names(Path(".venv") / "bin") or set()
+			if tool in venv_bin:
 				results[tool] = "available (venv)"
 			else:
 				results[tool] = "not found"
@@ -268,6 +272,15 @@ def check_tool_availability(tools_required: list[str]) -> dict[str, object]:
 	}
 
 
+def _existing_names(dirpath: Path) -> set[str] | None:
+	"""List entry names in a directory with one scandir, or None if it doesn't exist."""
+	try:
+		with os.scandir(dirpath) as it:
+			return {entry.name for entry in it}
+	except (FileNotFoundError, NotADirectoryError):
+		return None
+
+
 def _replace_field(content: str, field: str, value: str) -> str:
 	"""Replace a 'Field: value' line in the content."""
 	lines = content.splitlines()
@@ -286,12 +299,12 @@ def _get_last_modified(path: Path) -> str:
 	return datetime.fromtimestamp(mtime).isoformat()
 
 
-_MCP_TOOL_NAMES = {
+_MCP_TOOL_NAMES = frozenset({
 	"health_check", "find_project", "list_my_projects",
 	"update_project_status", "log_project_decision", "log_project_gotcha",
 	"log_global_learning", "run_verification",
 	"init_project_workflow", "workflow_progress", "check_tools",
-}
+})
 
 
 def _is_mcp_tool(name: str) -> bool:
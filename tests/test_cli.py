@@ -1,9 +1,23 @@
 """Tests for the CLI install command."""
 
 import json
+import sys
+from functools import partial
 from pathlib import Path
 
-from claude_orchestrator.cli import _ensure_env_settings, _install_protocol, _update_hook_settings
+import pytest
+
+from claude_orchestrator import cli
+from claude_orchestrator.cli import (
+	_add_session_hook,
+	_enable_agent_teams,
+	_install_agents,
+	_install_hook,
+	_install_protocol,
+	_update_settings,
+	_write_settings,
+	main,
+)
 
 
 def test_install_adds_protocol(tmp_path: Path):
@@ -68,7 +82,7 @@ def test_hook_settings_uses_matcher_group_format(tmp_path: Path):
 	"""Hook entries must use the matcher-group format with nested hooks array."""
 	settings_path = tmp_path / "settings.json"
 
-	_update_hook_settings(settings_path, "/path/to/hook.sh")
+	_update_settings(settings_path, partial(_add_session_hook, hook_script="/path/to/hook.sh"))
 
 	data = json.loads(settings_path.read_text(encoding="utf-8"))
 	session_hooks = data["hooks"]["SessionStart"]
@@ -99,42 +113,158 @@ def test_hook_settings_detects_existing_nested_hook(tmp_path: Path, capsys):
 	}
 	settings_path.write_text(json.dumps(existing), encoding="utf-8")
 
-	_update_hook_settings(settings_path, "/path/to/hook.sh")
+	_update_settings(settings_path, partial(_add_session_hook, hook_script="/path/to/hook.sh"))
 
 	captured = capsys.readouterr()
 	assert "already configured" in captured.out
 
 
-def test_ensure_env_settings_adds_agent_teams(tmp_path: Path):
-	"""_ensure_env_settings should add agent teams env var to settings.json."""
+def test_enable_agent_teams_adds_agent_teams(tmp_path: Path):
+	"""_enable_agent_teams should add agent teams env var to settings.json."""
 	settings_path = tmp_path / "settings.json"
 
-	_ensure_env_settings(settings_path)
+	_update_settings(settings_path, _enable_agent_teams)
 
 	data = json.loads(settings_path.read_text(encoding="utf-8"))
 	assert data["env"]["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] == "1"
 
 
-def test_ensure_env_settings_preserves_existing(tmp_path: Path):
-	"""_ensure_env_settings should not overwrite existing env vars."""
+def test_enable_agent_teams_preserves_existing(tmp_path: Path):
+	"""_enable_agent_teams should not overwrite existing env vars."""
 	settings_path = tmp_path / "settings.json"
 	existing = {"env": {"MY_VAR": "hello"}, "hooks": {}}
 	settings_path.write_text(json.dumps(existing), encoding="utf-8")
 
-	_ensure_env_settings(settings_path)
+	_update_settings(settings_path, _enable_agent_teams)
 
 	data = json.loads(settings_path.read_text(encoding="utf-8"))
 	assert data["env"]["MY_VAR"] == "hello"
 	assert data["env"]["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] == "1"
 
 
-def test_ensure_env_settings_skips_if_already_set(tmp_path: Path, capsys):
-	"""_ensure_env_settings should skip if env var already set."""
+def test_enable_agent_teams_skips_if_already_set(tmp_path: Path, capsys):
+	"""_enable_agent_teams should skip if env var already set."""
 	settings_path = tmp_path / "settings.json"
 	existing = {"env": {"CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS": "1"}}
 	settings_path.write_text(json.dumps(existing), encoding="utf-8")
 
-	_ensure_env_settings(settings_path)
+	_update_settings(settings_path, _enable_agent_teams)
 
 	captured = capsys.readouterr()
 	assert "already set" in captured.out
+
+
+def test_write_settings_is_atomic_and_follows_symlinks(tmp_path: Path):
+	"""_write_settings should leave no temp file and update a symlink's target."""
+	real = tmp_path / "dotfiles" / "settings.json"
+	real.parent.mkdir()
+	real.write_text("{}", encoding="utf-8")
+	link = tmp_path / "settings.json"
+	link.symlink_to(real)
+
+	_write_settings(link, {"env": {"A": "1"}})
+
+	assert link.is_symlink()
+	assert json.loads(real.read_text(encoding="utf-8")) == {"env": {"A": "1"}}
+	assert list(real.parent.iterdir()) == [real]
+
+
+def test_install_hook_reports_installed_then_replaced(tmp_path: Path, capsys):
+	"""_install_hook should say Installed on first run and Replaced with --force."""
+	_install_hook(tmp_path, force=False)
+	assert "Installed:" in capsys.readouterr().out
+
+	(tmp_path / "scripts" / "workflow-session-start.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+	_install_hook(tmp_path, force=True)
+	assert "Replaced:" in capsys.readouterr().out
+
+
+def test_install_hook_force_skips_identical_script(tmp_path: Path, capsys):
+	"""--force should not rewrite a hook script that already matches the bundled one."""
+	_install_hook(tmp_path, force=False)
+	hook = tmp_path / "scripts" / "workflow-session-start.sh"
+	mtime = hook.stat().st_mtime_ns
+	capsys.readouterr()
+
+	_install_hook(tmp_path, force=True)
+
+	assert "already up to date" in capsys.readouterr().out
+	assert hook.stat().st_mtime_ns == mtime
+
+
+def test_install_hook_force_restores_exec_bit(tmp_path: Path):
+	"""--force should make an identical hook script executable again."""
+	_install_hook(tmp_path, force=False)
+	hook = tmp_path / "scripts" / "workflow-session-start.sh"
+	hook.chmod(0o644)
+
+	_install_hook(tmp_path, force=True)
+
+	assert hook.stat().st_mode & 0o777 == 0o755
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_version_flag(flag: str, monkeypatch: pytest.MonkeyPatch, capsys):
+	"""--version should print the package version and exit cleanly."""
+	monkeypatch.setattr(sys, "argv", ["claude-orchestrator", flag])
+
+	assert main() == 0
+	assert capsys.readouterr().out.startswith("claude-orchestrator ")
+
+
+def test_install_hook_updates_settings_in_one_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+	"""_install_hook should add hook and env var with a single settings.json write."""
+	writes = []
+	real_write = cli._write_settings
+	monkeypatch.setattr(cli, "_write_settings", lambda path, data: (writes.append(path), real_write(path, data)))
+
+	_install_hook(tmp_path, force=False)
+	assert len(writes) == 1
+
+	data = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+	assert data["env"]["CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS"] == "1"
+	assert data["hooks"]["SessionStart"][0]["hooks"][0]["command"].endswith("workflow-session-start.sh")
+
+	# Re-running with everything configured should not rewrite the file
+	_install_hook(tmp_path, force=False)
+	assert len(writes) == 1
+
+
+def test_update_settings_reports_failure_without_success_lines(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+):
+	"""A failed write should print only the failure, not the updaters' success messages."""
+	def fail_write(path: Path, data: dict[str, object]) -> None:
+		raise OSError("read-only file system")
+
+	monkeypatch.setattr(cli, "_write_settings", fail_write)
+
+	_update_settings(tmp_path / "settings.json", _enable_agent_teams)
+
+	out = capsys.readouterr().out
+	assert "Failed to update" in out
+	assert "Enabled agent teams" not in out
+
+
+def test_install_agents_skips_existing_without_force(tmp_path: Path, capsys):
+	"""_install_agents should skip files already present and install the rest."""
+	agents_dir = tmp_path / "agents"
+	agents_dir.mkdir()
+	(agents_dir / "researcher.md").write_text("custom", encoding="utf-8")
+
+	_install_agents(agents_dir, force=False)
+
+	assert (agents_dir / "researcher.md").read_text(encoding="utf-8") == "custom"
+	assert (agents_dir / "verifier.md").exists()
+	assert "1 skipped" in capsys.readouterr().out
+
+
+def test_update_settings_rejects_non_object_json(tmp_path: Path, capsys):
+	"""A settings.json that isn't a JSON object should be reported and left untouched."""
+	settings_path = tmp_path / "settings.json"
+	settings_path.write_text("[]", encoding="utf-8")
+
+	_install_hook(tmp_path, force=False)
+
+	assert "Failed to update" in capsys.readouterr().out
+	assert settings_path.read_text(encoding="utf-8") == "[]"
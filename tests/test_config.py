@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
-from claude_orchestrator.config import Config, _apply_env_overrides, load_config
+from claude_orchestrator.config import Config, _apply_env_overrides, _apply_toml, load_config
 
 
 def test_config_defaults():
@@ -51,3 +51,18 @@ def test_load_config_creates_dirs(tmp_path: Path):
 		config = load_config()
 		assert config.data_dir.exists()
 		assert config.config_dir.exists()
+
+
+def test_apply_toml_overrides_projects_path(tmp_path: Path):
+	"""config.toml values should override the defaults."""
+	(tmp_path / "config.toml").write_text('projects_path = "/tmp/projects-a"\n', encoding="utf-8")
+
+	config = _apply_toml(Config(config_dir=tmp_path))
+
+	assert config.projects_path == Path("/tmp/projects-a")
+
+
+def test_apply_toml_missing_file(tmp_path: Path):
+	"""A missing config.toml should leave the config untouched."""
+	config = Config(config_dir=tmp_path, projects_path=tmp_path / "projects")
+	assert _apply_toml(config).projects_path == tmp_path / "projects"
@@ -0,0 +1,78 @@
+"""Tests for project discovery and lookup."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from claude_orchestrator.context import ContextManager, ProjectInfo
+
+
+def _make_projects(root: Path, *names: str) -> None:
+	for name in names:
+		(root / name).mkdir()
+
+
+def test_find_project_prefers_exact_match(tmp_path: Path):
+	"""An exact name match should win even if another project matches partially."""
+	_make_projects(tmp_path, "api", "api-gateway")
+
+	project = ContextManager(str(tmp_path)).find_project("API")
+
+	assert project is not None
+	assert project.name == "api"
+
+
+def test_find_project_partial_and_missing(tmp_path: Path):
+	"""Partial names should match; unknown names should return None."""
+	_make_projects(tmp_path, "claude-orchestrator")
+	manager = ContextManager(str(tmp_path))
+
+	project = manager.find_project("orchestrator")
+
+	assert project is not None
+	assert project.name == "claude-orchestrator"
+	assert manager.find_project("nonexistent") is None
+
+
+def test_discover_skips_hidden_tooling_and_files(tmp_path: Path):
+	"""Discovery should list only regular project directories."""
+	_make_projects(tmp_path, "alpha", ".git", "venv", "node_modules", "__pycache__")
+	(tmp_path / "notes.md").write_text("not a project", encoding="utf-8")
+
+	projects = ContextManager(str(tmp_path)).load().projects
+
+	assert [p.name for p in projects] == ["alpha"]
+	assert projects[0].path == str(tmp_path / "alpha")
+
+
+def test_discover_missing_projects_path(tmp_path: Path):
+	"""A missing projects folder should yield an empty registry."""
+	assert ContextManager(str(tmp_path / "missing")).load().projects == []
+
+
+def test_load_reuses_registry_until_folder_changes(tmp_path: Path):
+	"""load() should return the cached registry until the projects folder changes."""
+	_make_projects(tmp_path, "alpha")
+	manager = ContextManager(str(tmp_path))
+
+	first = manager.load()
+	assert manager.load() is first
+
+	_make_projects(tmp_path, "beta")
+	# Bump mtime explicitly in case the filesystem's timestamp granularity is coarse
+	st = tmp_path.stat()
+	os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+	assert sorted(p.name for p in manager.load().projects) == ["alpha", "beta"]
+	assert manager.find_project("beta") is not None
+
+
+def test_find_project_matches_alias_case_insensitively(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+	"""Aliases should match regardless of case in either the alias or the query."""
+	manager = ContextManager(str(tmp_path))
+	project = ProjectInfo(name="health-tracker", path="/tmp/ht", description="", aliases=["Fitness"])
+	monkeypatch.setattr(manager, "_discover_projects", lambda: [project])
+
+	assert manager.find_project("FITNESS app") is project
+	assert manager.find_project("tracker") is project
@@ -0,0 +1,53 @@
+"""Tests for the atomic file write helper."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from claude_orchestrator import fileio
+from claude_orchestrator.fileio import write_file
+
+
+def _mode(path: Path) -> int:
+	return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_write_file_keeps_existing_permissions(tmp_path: Path):
+	"""Rewriting a 0600 file should not widen its permissions."""
+	target = tmp_path / "settings.json"
+	target.write_text("{}", encoding="utf-8")
+	target.chmod(0o600)
+
+	write_file(target, '{"env": {}}\n')
+
+	assert target.read_text(encoding="utf-8") == '{"env": {}}\n'
+	assert _mode(target) == 0o600
+
+
+def test_write_file_new_file_uses_umask_mode(tmp_path: Path):
+	"""A newly created file should get the same mode a plain open() would give it."""
+	target = tmp_path / "CLAUDE.md"
+
+	write_file(target, "# Project\n")
+
+	assert _mode(target) == 0o666 & ~fileio._UMASK
+	assert list(tmp_path.iterdir()) == [target]
+
+
+def test_write_file_cleans_up_temp_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+	"""A failed replace should leave the original file and no temp file behind."""
+	target = tmp_path / "CLAUDE.md"
+	target.write_text("original", encoding="utf-8")
+
+	def fail_replace(src: str, dst: Path) -> None:
+		raise OSError("disk full")
+
+	monkeypatch.setattr(os, "replace", fail_replace)
+
+	with pytest.raises(OSError, match="disk full"):
+		write_file(target, "new")
+
+	assert target.read_text(encoding="utf-8") == "original"
+	assert list(tmp_path.iterdir()) == [target]
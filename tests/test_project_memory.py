@@ -0,0 +1,62 @@
+"""Tests for project memory updates to CLAUDE.md and global learnings."""
+
+from pathlib import Path
+
+import pytest
+
+from claude_orchestrator.project_memory import log_global_learning, update_implementation_status
+
+GLOBAL_LEARNINGS = """# Global Learnings
+
+*Last updated: 2000-01-01*
+
+## User Preferences
+
+## Technical Patterns That Work
+- Existing pattern
+
+---
+"""
+
+
+@pytest.fixture
+def fake_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+	"""Point Path.home() at a temp dir containing a global learnings file."""
+	(tmp_path / ".claude").mkdir()
+	(tmp_path / ".claude" / "global-learnings.md").write_text(GLOBAL_LEARNINGS, encoding="utf-8")
+	monkeypatch.setattr(Path, "home", lambda: tmp_path)
+	return tmp_path
+
+
+def test_log_global_learning_appends_and_stamps(fake_home: Path):
+	"""log_global_learning should append to the section and refresh the timestamp."""
+	result = log_global_learning("pattern", "Use tabs")
+
+	assert result["success"] is True
+	content = (fake_home / ".claude" / "global-learnings.md").read_text(encoding="utf-8")
+	assert "- Existing pattern\n- Use tabs\n" in content
+	assert "*Last updated: 2000-01-01*" not in content
+
+
+def test_log_global_learning_unknown_category(fake_home: Path):
+	"""Unknown categories should be rejected without touching the file."""
+	result = log_global_learning("misc", "Anything")
+
+	assert result["success"] is False
+	content = (fake_home / ".claude" / "global-learnings.md").read_text(encoding="utf-8")
+	assert content == GLOBAL_LEARNINGS
+
+
+def test_update_implementation_status_checks_off_literal_phase(tmp_path: Path):
+	"""Phase names are matched literally, including backslashes and brackets."""
+	phase = r"Phase 2: Parse C:\temp [v1]"
+	(tmp_path / "CLAUDE.md").write_text(
+		f"# Project\n\n## Implementation Status\n- [ ] {phase}\n\n## Next\n",
+		encoding="utf-8",
+	)
+
+	result = update_implementation_status(str(tmp_path), phase_completed=phase, commit_hash="abc123")
+
+	assert result["success"] is True
+	content = (tmp_path / "CLAUDE.md").read_text(encoding="utf-8")
+	assert f"- [x] {phase} (commit: abc123)\n" in content
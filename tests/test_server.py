@@ -41,3 +41,35 @@ def test_server_tool_names():
 
 	extra = tool_names - EXPECTED_TOOLS
 	assert not extra, f"Unexpected tools: {extra}"
+
+
+async def test_workflow_tool_writes_files(tmp_path):
+	"""File-writing tools should still complete when run off the event loop."""
+	from claude_orchestrator.server import mcp
+
+	await mcp.call_tool("init_project_workflow", {"project_path": str(tmp_path)})
+
+	assert (tmp_path / ".claude-project" / "progress.md").exists()
+
+
+async def test_verification_gotchas_logged_to_claude_md(tmp_path):
+	"""run_verification should log failure gotchas through the shared file-update path."""
+	from unittest.mock import patch
+
+	from claude_orchestrator.orchestrator.verifier import CheckResult, CheckStatus, VerificationResult, Verifier
+	from claude_orchestrator.server import mcp
+
+	(tmp_path / "CLAUDE.md").write_text("# Project\n\n## Gotchas & Learnings\n", encoding="utf-8")
+	failed = VerificationResult(
+		passed=False,
+		checks=[CheckResult(name="ruff", status=CheckStatus.FAILED, output="src/a.py:1:1: F401 unused")],
+	)
+
+	async def fake_verify(self, checks=None, files_changed=None):
+		return failed
+
+	with patch.object(Verifier, "verify", fake_verify):
+		await mcp.call_tool("run_verification", {"project_path": str(tmp_path), "checks": "ruff"})
+
+	content = (tmp_path / "CLAUDE.md").read_text(encoding="utf-8")
+	assert "F401" in content
@@ -22,6 +22,7 @@ from claude_orchestrator.orchestrator.verifier import (
 	VerificationResult,
 	Verifier,
 )
+from claude_orchestrator.tools.verification import _derive_gotcha_from_failure, _should_recommend_consensus_review
 
 
 class TestVerifierInitialization:
@@ -197,6 +198,26 @@ class TestVerifierChecks:
 		assert result.checks[0].status == CheckStatus.ERROR
 		assert "timed out" in result.checks[0].output.lower()
 
+	@pytest.mark.asyncio
+	async def test_verify_runs_checks_concurrently(self, verifier):
+		"""Checks should overlap while results keep the requested order."""
+		running = 0
+		peak = 0
+
+		async def mock_run_check(check, files=None):
+			nonlocal running, peak
+			running += 1
+			peak = max(peak, running)
+			await asyncio.sleep(0.05 if check == "pytest" else 0.01)
+			running -= 1
+			return CheckResult(name=check, status=CheckStatus.PASSED)
+
+		with patch.object(verifier, "_run_check", mock_run_check):
+			result = await verifier.verify(checks=["pytest", "ruff", "mypy"])
+
+		assert peak == 3
+		assert [c.name for c in result.checks] == ["pytest", "ruff", "mypy"]
+
 	@pytest.mark.asyncio
 	async def test_verify_with_files_changed(self, verifier):
 		"""Test verification with specific changed files."""
@@ -401,6 +422,54 @@ class TestCustomVerification:
 		assert "timed out" in result.output.lower()
 
 
+class TestConsensusReview:
+	"""Tests for consensus review recommendation."""
+
+	def test_no_files(self):
+		"""No changed files should not recommend review."""
+		assert _should_recommend_consensus_review(None) == (False, "")
+
+	def test_security_files_match_case_insensitively(self):
+		"""Security-sensitive paths should match regardless of case."""
+		recommend, reason = _should_recommend_consensus_review(["src/Auth/LoginHandler.py"])
+
+		assert recommend is True
+		assert "security-sensitive files: src/Auth/LoginHandler.py" in reason
+
+	def test_architecture_files(self):
+		"""Architecture paths should be reported separately."""
+		recommend, reason = _should_recommend_consensus_review(["src/CONFIG.py", "README.md"])
+
+		assert recommend is True
+		assert "architecture files: src/CONFIG.py" in reason
+		assert "security" not in reason
+
+	def test_plain_files_not_flagged(self):
+		"""Ordinary files under the multi-file threshold should not recommend review."""
+		assert _should_recommend_consensus_review(["docs/guide.md", "src/utils.py"]) == (False, "")
+
+
+class TestDeriveGotcha:
+	"""Tests for turning check failures into gotchas."""
+
+	def test_ruff_rule_codes(self):
+		"""Ruff failures should list the unique rule codes."""
+		check = CheckResult(name="ruff", status=CheckStatus.FAILED, output="a.py:1:1: F401\nb.py:2:1: E501\nc.py: F401")
+		assert _derive_gotcha_from_failure(check) == "Linting: fix E501, F401 violations before committing"
+
+	def test_pytest_failed_names(self):
+		"""Pytest failures should name the failing tests."""
+		check = CheckResult(name="pytest", status=CheckStatus.FAILED, output="FAILED tests/test_a.py::test_one - boom")
+		assert _derive_gotcha_from_failure(check) == (
+			"Tests: fix failing tests before committing -- tests/test_a.py::test_one"
+		)
+
+	def test_mypy_error_count(self):
+		"""Mypy failures should report the error count."""
+		check = CheckResult(name="mypy", status=CheckStatus.FAILED, output="Found 3 errors in 2 files")
+		assert _derive_gotcha_from_failure(check) == "Types: fix 3 mypy type error(s) before committing"
+
+
 class TestVerificationIntegration:
 	"""Integration tests for verification flow."""
 
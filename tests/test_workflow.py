@@ -70,7 +70,7 @@ def test_get_state_fresh(tmp_path: Path):
 	assert state.has_discover is True
 	assert state.has_plan is True
 	assert state.has_progress is True
-	assert state.research_topics == []
+	assert state.research_topics == ()
 
 
 def test_update_progress_completes_phase(tmp_path: Path):
@@ -140,6 +140,24 @@ def test_check_tool_availability_venv(tmp_path: Path, monkeypatch: "pytest.Monke
 	assert result["all_available"] is True
 
 
+def test_check_tool_availability_venv_multiple(tmp_path: Path, monkeypatch: "pytest.MonkeyPatch"):
+	"""Several venv lookups in one call should each resolve against .venv/bin/."""
+	venv_bin = tmp_path / ".venv" / "bin"
+	venv_bin.mkdir(parents=True)
+	(venv_bin / "tool_a_xyz").touch()
+	(venv_bin / "tool_b_xyz").touch()
+
+	monkeypatch.chdir(tmp_path)
+	result = check_tool_availability(["tool_a_xyz", "tool_b_xyz", "tool_c_xyz"])
+
+	assert result["tools"] == {
+		"tool_a_xyz": "available (venv)",
+		"tool_b_xyz": "available (venv)",
+		"tool_c_xyz": "not found",
+	}
+	assert result["all_available"] is False
+
+
 def test_check_tool_availability_mcp():
 	"""MCP tools should be reported as assumed available."""
 	result = check_tool_availability(["run_verification"])
@@ -159,3 +177,17 @@ def test_research_topics(tmp_path: Path):
 	state = get_workflow_state(str(tmp_path))
 	assert "api-design" in state.research_topics
 	assert "testing-strategy" in state.research_topics
+
+
+def test_research_topics_sorted_md_only(tmp_path: Path):
+	"""Research topics should be sorted by filename and ignore non-markdown entries."""
+	init_workflow(str(tmp_path))
+
+	research_dir = tmp_path / WORKFLOW_DIR / "research"
+	(research_dir / "zeta.md").write_text("# Zeta")
+	(research_dir / "alpha.md").write_text("# Alpha")
+	(research_dir / "notes.txt").write_text("scratch")
+	(research_dir / "drafts").mkdir()
+
+	state = get_workflow_state(str(tmp_path))
+	assert state.research_topics == ("alpha", "zeta")